@@ -4,6 +4,7 @@ Provides support for capturing video from cameras and integrating it into presen
 """
 
 import cv2
+import sys
 import threading
 import time
 import logging
@@ -15,6 +16,15 @@ from typing import Dict, List, Optional, Union, Tuple, Any
 # Configure logging
 logger = logging.getLogger("CameraModule")
 
+# Backend hint for probing local devices: V4L2/DSHOW open much faster than
+# backend autodetection on their native platforms.
+if sys.platform == "win32":
+    _PROBE_BACKEND = cv2.CAP_DSHOW
+elif sys.platform.startswith("linux"):
+    _PROBE_BACKEND = cv2.CAP_V4L2
+else:
+    _PROBE_BACKEND = cv2.CAP_ANY
+
 class CameraManager:
     """
     Manages camera devices and video streams.
@@ -22,11 +32,23 @@ class CameraManager:
     """
     
     def __init__(self, config: Dict[str, Any]):
-        self.cameras = {}  # Dictionary of camera objects
-        self.active_camera = None  # Currently active camera
+        # Camera registry held as parallel (SoA-style) arrays indexed by an
+        # integer slot, so batch iteration (cleanup, discovery) and the hot
+        # capture path touch compact lists instead of scattered dicts.
+        self.cam_ids: List[str] = []
+        self.cam_names: List[str] = []
+        self.cam_sources: List[Union[int, str]] = []
+        self.cam_types: List[str] = []
+        self.cam_caps: List[Optional[cv2.VideoCapture]] = []
+        self.cam_active: List[bool] = []
+        self.active_idx: Optional[int] = None  # Index of the active camera
         self.config = config
         self.frame_queue = queue.Queue(maxsize=10)  # Queue for frames to be processed
         self.processed_frame = None  # Latest processed frame
+        self.frame_version = 0  # Incremented whenever processed_frame changes
+        self._jpeg_cache = None  # JPEG bytes of the last encoded frame
+        self._jpeg_version = -1  # frame_version the cache was encoded from
+        self._jpeg_lock = threading.Lock()
         self.running = False
         self.processing_thread = None
         self.camera_thread = None
@@ -40,6 +62,7 @@ class CameraManager:
             "sepia": self._effect_sepia
         }
         self.current_effect = "none"
+        self._effect_fn = self._effect_none  # Bound effect callable used by the hot loop
         
         # Position and size settings
         self.position = "bottom-right"  # Where to position the camera feed
@@ -49,7 +72,51 @@ class CameraManager:
         
         # Picture-in-picture mode
         self.pip_mode = True  # If True, camera is shown as an overlay
-    
+
+        # Reusable output buffers for effects and overlay compositing.
+        # Allocated lazily to the first frame's shape and passed as dst=
+        # to OpenCV calls to avoid per-frame allocations.
+        self._buffers: Dict[str, np.ndarray] = {}
+        # The effect output alternates between two buffers (see
+        # _next_effect_buf) so the frame published to consumers is
+        # never the in-place write target of the next iteration.
+        self._effect_flip = 0
+
+    def _ensure_buf(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Get a reusable buffer by name, (re)allocating if shape or dtype changed."""
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype)
+            self._buffers[name] = buf
+        return buf
+
+    def _next_effect_buf(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Output buffer for the frame being processed now.
+
+        Ping-pongs between two buffers: the one currently published as
+        processed_frame (being JPEG-encoded or resized by readers on
+        other threads) is left untouched while this frame's effect
+        writes into the other. Intermediate scratch buffers are never
+        published, so only the output needs two slots.
+        """
+        self._effect_flip ^= 1
+        return self._ensure_buf(f"effect{self._effect_flip}", shape)
+
+    @property
+    def active_camera(self) -> Optional[str]:
+        """Id of the currently active camera, or None."""
+        if self.active_idx is None:
+            return None
+        return self.cam_ids[self.active_idx]
+
+    def _index_of(self, camera_id: str) -> Optional[int]:
+        """Return the slot index of a camera id, or None if unknown."""
+        try:
+            return self.cam_ids.index(camera_id)
+        except ValueError:
+            return None
+
     def discover_cameras(self) -> List[Dict[str, Any]]:
         """
         Discover available camera devices.
@@ -60,13 +127,16 @@ class CameraManager:
         # Try to access the first 5 camera indices (adjust as needed)
         for i in range(5):
             try:
-                cap = cv2.VideoCapture(i)
+                cap = cv2.VideoCapture(i, _PROBE_BACKEND)
                 if cap.isOpened():
-                    # Get camera details
+                    # Query width/height only; fps is the slowest property
+                    # on most backends, so take one reading and report
+                    # None rather than retrying when it comes back 0.
                     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
                     height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                    fps = cap.get(cv2.CAP_PROP_FPS)
-                    
+                    fps = cap.get(cv2.CAP_PROP_FPS) or None
+                    cap.release()
+
                     camera_info = {
                         "id": f"camera_{i}",
                         "name": f"Camera {i}",
@@ -77,7 +147,6 @@ class CameraManager:
                     }
                     
                     camera_list.append(camera_info)
-                    cap.release()
             except Exception as e:
                 logger.debug(f"Error checking camera {i}: {str(e)}")
         
@@ -97,15 +166,13 @@ class CameraManager:
                 camera_type = "local"
                 source = int(source) if isinstance(source, str) and source.isdigit() else source
             
-            self.cameras[camera_id] = {
-                "id": camera_id,
-                "name": name,
-                "source": source,
-                "type": camera_type,
-                "cap": None,  # Will be initialized when used
-                "active": False
-            }
-            
+            self.cam_ids.append(camera_id)
+            self.cam_names.append(name)
+            self.cam_sources.append(source)
+            self.cam_types.append(camera_type)
+            self.cam_caps.append(None)  # Will be initialized when used
+            self.cam_active.append(False)
+
             logger.info(f"Added camera: {name} ({camera_id})")
             return True
         
@@ -115,49 +182,64 @@ class CameraManager:
     
     def remove_camera(self, camera_id: str) -> bool:
         """Remove a camera from the manager."""
-        if camera_id in self.cameras:
-            # Release capture if it's open
-            if self.cameras[camera_id]["cap"] is not None:
-                self.cameras[camera_id]["cap"].release()
-            
-            # Remove from dictionary
-            del self.cameras[camera_id]
-            logger.info(f"Removed camera: {camera_id}")
-            
-            # If this was the active camera, deactivate it
-            if self.active_camera == camera_id:
-                self.active_camera = None
-            
-            return True
-        
-        return False
+        idx = self._index_of(camera_id)
+        if idx is None:
+            return False
+
+        # Release capture if it's open
+        if self.cam_caps[idx] is not None:
+            self.cam_caps[idx].release()
+
+        # If this was the active camera, deactivate it
+        if self.active_idx == idx:
+            self.active_idx = None
+
+        # Swap-and-pop to keep the parallel arrays dense
+        last = len(self.cam_ids) - 1
+        arrays = (self.cam_ids, self.cam_names, self.cam_sources,
+                  self.cam_types, self.cam_caps, self.cam_active)
+        if idx != last:
+            for arr in arrays:
+                arr[idx] = arr[last]
+            if self.active_idx == last:
+                self.active_idx = idx
+        for arr in arrays:
+            arr.pop()
+
+        logger.info(f"Removed camera: {camera_id}")
+        return True
     
     def activate_camera(self, camera_id: str) -> bool:
         """Activate a specific camera."""
-        if camera_id not in self.cameras:
+        idx = self._index_of(camera_id)
+        if idx is None:
             logger.error(f"Camera not found: {camera_id}")
             return False
-        
+
         # If there's already an active camera, deactivate it first
-        if self.active_camera and self.active_camera != camera_id:
+        if self.active_idx is not None and self.active_idx != idx:
             self.deactivate_camera()
-        
+            idx = self._index_of(camera_id)
+
         # Initialize camera capture if needed
-        if self.cameras[camera_id]["cap"] is None:
+        if self.cam_caps[idx] is None:
             try:
-                cap = cv2.VideoCapture(self.cameras[camera_id]["source"])
+                cap = cv2.VideoCapture(self.cam_sources[idx])
                 if not cap.isOpened():
                     logger.error(f"Failed to open camera: {camera_id}")
                     return False
-                
-                self.cameras[camera_id]["cap"] = cap
+
+                # Keep only the newest frame in the driver buffer so the
+                # blocking read() below always returns fresh data.
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                self.cam_caps[idx] = cap
             except Exception as e:
                 logger.error(f"Error initializing camera {camera_id}: {str(e)}")
                 return False
-        
+
         # Set as active camera
-        self.active_camera = camera_id
-        self.cameras[camera_id]["active"] = True
+        self.active_idx = idx
+        self.cam_active[idx] = True
         
         # Start camera thread if not already running
         if not self.running:
@@ -168,54 +250,75 @@ class CameraManager:
             self.processing_thread = threading.Thread(target=self._processing_thread, daemon=True)
             self.processing_thread.start()
         
-        logger.info(f"Activated camera: {self.cameras[camera_id]['name']} ({camera_id})")
+        logger.info(f"Activated camera: {self.cam_names[idx]} ({camera_id})")
         return True
-    
+
     def deactivate_camera(self) -> bool:
         """Deactivate the currently active camera."""
-        if not self.active_camera:
+        idx = self.active_idx
+        if idx is None:
             return False
-        
+
         # Mark camera as inactive
-        self.cameras[self.active_camera]["active"] = False
-        
+        self.cam_active[idx] = False
+
         # Stop threads
         self.running = False
         if self.camera_thread and self.camera_thread.is_alive():
             self.camera_thread.join(timeout=1.0)
-        
+
         if self.processing_thread and self.processing_thread.is_alive():
             self.processing_thread.join(timeout=1.0)
-        
+
         # Release capture
-        if self.cameras[self.active_camera]["cap"] is not None:
-            self.cameras[self.active_camera]["cap"].release()
-            self.cameras[self.active_camera]["cap"] = None
-        
-        logger.info(f"Deactivated camera: {self.cameras[self.active_camera]['name']} ({self.active_camera})")
-        self.active_camera = None
+        if self.cam_caps[idx] is not None:
+            self.cam_caps[idx].release()
+            self.cam_caps[idx] = None
+
+        logger.info(f"Deactivated camera: {self.cam_names[idx]} ({self.cam_ids[idx]})")
+        self.active_idx = None
         return True
     
     def get_frame(self) -> Optional[np.ndarray]:
         """Get the most recent processed frame from the active camera."""
         return self.processed_frame
     
-    def get_encoded_frame(self) -> Optional[str]:
-        """Get the most recent processed frame as a base64-encoded JPEG."""
-        if self.processed_frame is None:
+    def get_jpeg_frame(self) -> Optional[bytes]:
+        """
+        Get the most recent processed frame as JPEG bytes.
+        Each frame is encoded at most once; the result is cached and shared
+        across all clients (WebSocket and REST).
+        """
+        frame = self.processed_frame
+        if frame is None:
             return None
-        
+
         try:
-            _, encoded_img = cv2.imencode('.jpg', self.processed_frame)
-            return base64.b64encode(encoded_img).decode('utf-8')
+            version = self.frame_version
+            with self._jpeg_lock:
+                if version != self._jpeg_version:
+                    ret, encoded_img = cv2.imencode('.jpg', frame)
+                    if not ret:
+                        return None
+                    self._jpeg_cache = encoded_img.tobytes()
+                    self._jpeg_version = version
+                return self._jpeg_cache
         except Exception as e:
             logger.error(f"Error encoding frame: {str(e)}")
             return None
+
+    def get_encoded_frame(self) -> Optional[str]:
+        """Get the most recent processed frame as a base64-encoded JPEG."""
+        jpeg = self.get_jpeg_frame()
+        if jpeg is None:
+            return None
+        return base64.b64encode(jpeg).decode('utf-8')
     
     def set_effect(self, effect_name: str) -> bool:
         """Set the current video effect."""
         if effect_name in self.effects:
             self.current_effect = effect_name
+            self._effect_fn = self.effects[effect_name]
             logger.info(f"Set camera effect: {effect_name}")
             return True
         
@@ -250,16 +353,19 @@ class CameraManager:
     
     def _camera_thread(self) -> None:
         """Thread function to continuously capture frames from the camera."""
-        while self.running and self.active_camera:
+        while self.running and self.active_idx is not None:
             try:
-                camera = self.cameras[self.active_camera]
-                if not camera["active"] or camera["cap"] is None:
+                idx = self.active_idx
+                cap = self.cam_caps[idx]
+                if not self.cam_active[idx] or cap is None:
                     time.sleep(0.1)
                     continue
-                
-                ret, frame = camera["cap"].read()
+
+                # cap.read() blocks until the driver has a frame, so no
+                # pacing sleep is needed on the success path.
+                ret, frame = cap.read()
                 if not ret:
-                    logger.warning(f"Failed to read frame from camera: {self.active_camera}")
+                    logger.warning(f"Failed to read frame from camera: {self.cam_ids[idx]}")
                     time.sleep(0.1)
                     continue
                 
@@ -281,15 +387,13 @@ class CameraManager:
                 # Get frame from queue
                 frame = self.frame_queue.get(timeout=0.1)
                 
-                # Apply effect
-                if self.current_effect in self.effects:
-                    processed = self.effects[self.current_effect](frame)
-                else:
-                    processed = frame
+                # Apply effect via the bound callable (updated in set_effect)
+                processed = self._effect_fn(frame)
                 
                 # Update processed frame
                 self.processed_frame = processed
-                
+                self.frame_version += 1
+
                 # Mark task as done
                 self.frame_queue.task_done()
             
@@ -307,28 +411,49 @@ class CameraManager:
     
     def _effect_grayscale(self, frame: np.ndarray) -> np.ndarray:
         """Convert frame to grayscale."""
-        return cv2.cvtColor(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), cv2.COLOR_GRAY2BGR)
-    
+        gray = self._ensure_buf("gray", frame.shape[:2])
+        out = self._next_effect_buf(frame.shape)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+        cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR, dst=out)
+        return out
+
     def _effect_blur(self, frame: np.ndarray) -> np.ndarray:
         """Apply Gaussian blur to frame."""
-        return cv2.GaussianBlur(frame, (15, 15), 0)
-    
+        out = self._next_effect_buf(frame.shape)
+        cv2.GaussianBlur(frame, (15, 15), 0, dst=out)
+        return out
+
     def _effect_edge(self, frame: np.ndarray) -> np.ndarray:
         """Apply edge detection to frame."""
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 100, 200)
-        return cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
-    
+        h, w = frame.shape[:2]
+        if self.pip_mode and w > 960:
+            # Edges are viewed at PIP size anyway, so run Canny at half
+            # resolution; the overlay path scales the result to fit.
+            small = self._ensure_buf("edge_small", (h // 2, w // 2, 3))
+            cv2.resize(frame, (w // 2, h // 2), dst=small, interpolation=cv2.INTER_AREA)
+            frame = small
+        gray = self._ensure_buf("gray", frame.shape[:2])
+        edges = self._ensure_buf("edges", frame.shape[:2])
+        out = self._next_effect_buf(frame.shape)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+        cv2.Canny(gray, 100, 200, edges=edges)
+        cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR, dst=out)
+        return out
+
     def _effect_sepia(self, frame: np.ndarray) -> np.ndarray:
         """Apply sepia tone effect to frame."""
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        normalized = np.array(gray, np.float32) / 255
-        sepia = np.ones(frame.shape)
-        sepia[:,:,0] *= 153  # B
-        sepia[:,:,1] *= 204  # G
-        sepia[:,:,2] *= 255  # R
-        sepia[:,:] *= normalized[:,:,np.newaxis]
-        return np.array(sepia, np.uint8)
+        gray = self._ensure_buf("gray", frame.shape[:2])
+        normalized = self._ensure_buf("sepia_norm", frame.shape[:2], np.float32)
+        sepia = self._ensure_buf("sepia_f32", frame.shape, np.float32)
+        out = self._next_effect_buf(frame.shape)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+        np.divide(gray, 255, out=normalized)
+        sepia[:,:,0] = 153  # B
+        sepia[:,:,1] = 204  # G
+        sepia[:,:,2] = 255  # R
+        sepia *= normalized[:,:,np.newaxis]
+        np.copyto(out, sepia, casting="unsafe")
+        return out
     
     def overlay_on_frame(self, main_frame: np.ndarray) -> np.ndarray:
         """
@@ -351,8 +476,9 @@ class CameraManager:
             new_w = int(main_w * self.size)
             new_h = int((cam_h / cam_w) * new_w)
             
-            # Resize camera frame
-            camera_frame = cv2.resize(self.processed_frame, (new_w, new_h))
+            # Resize camera frame into a reused buffer
+            camera_frame = self._ensure_buf("resize", (new_h, new_w, 3))
+            cv2.resize(self.processed_frame, (new_w, new_h), dst=camera_frame)
             
             # Calculate position
             if self.position == "top-left":
@@ -368,8 +494,9 @@ class CameraManager:
             else:
                 x, y = 10, 10  # Default to top-left
             
-            # Create a copy of the main frame to modify
-            result = main_frame.copy()
+            # Copy the main frame into a reused buffer to modify
+            result = self._ensure_buf("overlay", main_frame.shape)
+            np.copyto(result, main_frame)
             
             # Draw border
             if self.border_width > 0:
@@ -417,10 +544,10 @@ class CameraManager:
             self.processing_thread.join(timeout=1.0)
         
         # Release all cameras
-        for camera_id in list(self.cameras.keys()):
-            if self.cameras[camera_id]["cap"] is not None:
-                self.cameras[camera_id]["cap"].release()
-                self.cameras[camera_id]["cap"] = None
+        for idx, cap in enumerate(self.cam_caps):
+            if cap is not None:
+                cap.release()
+                self.cam_caps[idx] = None
         
         logger.info("Camera manager cleaned up")
 
@@ -466,9 +593,10 @@ def take_snapshot(camera_manager: CameraManager, filename: Optional[str] = None)
 # FastAPI routes for camera control
 def setup_camera_routes(app, camera_manager: CameraManager):
     """Set up FastAPI routes for camera control."""
-    from fastapi import APIRouter, HTTPException
+    import asyncio
+    from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
     from pydantic import BaseModel
-    
+
     router = APIRouter()
     
     class CameraInfo(BaseModel):
@@ -527,12 +655,36 @@ def setup_camera_routes(app, camera_manager: CameraManager):
     
     @router.get("/api/cameras/frame")
     async def get_camera_frame():
-        """Get the current camera frame as base64-encoded JPEG."""
+        """
+        Get the current camera frame as base64-encoded JPEG.
+        Compatibility shim; prefer the /ws/cameras/frame WebSocket stream.
+        """
         frame = camera_manager.get_encoded_frame()
         if frame:
             return {"success": True, "frame": frame}
         else:
             raise HTTPException(status_code=404, detail="No camera frame available")
+
+    @router.websocket("/ws/cameras/frame")
+    async def stream_camera_frames(websocket: WebSocket):
+        """
+        Stream camera frames to the client as binary JPEG WebSocket messages.
+        Frames are encoded once per version and fanned out to every client,
+        so the encode cost stays O(1) regardless of viewer count.
+        """
+        await websocket.accept()
+        last_version = -1
+        try:
+            while True:
+                version = camera_manager.frame_version
+                if version != last_version:
+                    jpeg = camera_manager.get_jpeg_frame()
+                    if jpeg is not None:
+                        await websocket.send_bytes(jpeg)
+                        last_version = version
+                await asyncio.sleep(0.03)
+        except WebSocketDisconnect:
+            pass
     
     @router.post("/api/cameras/effect")
     async def set_effect(request: EffectRequest):
@@ -4,9 +4,12 @@ Provides interfaces for controlling PowerPoint presentations.
 """
 
 import logging
+import mmap
+import os
 import platform
 import sys
-from typing import Optional, Tuple, Dict, Any
+import types
+from typing import Optional, Tuple, Dict, Any, Mapping
 
 # Configure logging
 logger = logging.getLogger("PowerPointController")
@@ -26,6 +29,18 @@ class PowerPointController:
         self.application = None
         self.presentation = None
         self.slideshow = None
+        self._view = None  # Cached SlideShowView, bound once per slideshow
+
+        # Status snapshot reused across get_status calls; callers get a
+        # read-only view of this dict rather than a fresh allocation.
+        self._status = {
+            "connected": False,
+            "simulation_mode": False,
+            "presentation_path": None,
+            "current_slide": 1,
+            "total_slides": self.total_slides
+        }
+        self._status_view = types.MappingProxyType(self._status)
         
         # Platform-specific setup
         self.platform = platform.system()
@@ -44,7 +59,21 @@ class PowerPointController:
                 # Use COM interface on Windows
                 try:
                     import win32com.client
-                    self.application = win32com.client.Dispatch("PowerPoint.Application")
+
+                    try:
+                        import pythoncom
+                        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+                    except Exception:
+                        pass  # Apartment already initialized for this thread
+
+                    try:
+                        # Early binding via the generated typelib stubs makes
+                        # each COM call a direct Invoke with cached DISPIDs
+                        # instead of a GetIDsOfNames round-trip per access.
+                        self.application = win32com.client.gencache.EnsureDispatch("PowerPoint.Application")
+                    except Exception:
+                        # Stubs unavailable (makepy never run); late binding still works
+                        self.application = win32com.client.Dispatch("PowerPoint.Application")
                     self.application.Visible = True
                     
                     # Check for open presentations
@@ -80,6 +109,30 @@ class PowerPointController:
             logger.error(f"Error in PowerPoint connection: {str(e)}")
             return False
     
+    def _prefetch_presentation(self, file_path: str) -> None:
+        """
+        Warm the OS page cache for the presentation file so PowerPoint's
+        subsequent open doesn't stall on cold disk or a network share.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return
+                if hasattr(os, "posix_fadvise"):
+                    # Kernel readahead with no Python-side copy
+                    os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+                else:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        if hasattr(mm, "madvise"):
+                            mm.madvise(mmap.MADV_WILLNEED)
+                        mm.read(min(size, 1 << 20))  # Touch the head to start readahead
+                    finally:
+                        mm.close()
+        except OSError as e:
+            logger.debug(f"Could not prefetch {file_path}: {str(e)}")
+
     def open_presentation(self, file_path: str) -> bool:
         """
         Open a PowerPoint presentation.
@@ -95,7 +148,8 @@ class PowerPointController:
         
         try:
             if not self.simulation_mode:
-                # Real PowerPoint
+                # Real PowerPoint: prefetch so COM's file open hits warm pages
+                self._prefetch_presentation(file_path)
                 self.presentation = self.application.Presentations.Open(file_path)
                 self.presentation_path = file_path
                 self.total_slides = self.presentation.Slides.Count
@@ -131,6 +185,7 @@ class PowerPointController:
             if not self.simulation_mode:
                 # Real PowerPoint
                 self.slideshow = self.presentation.SlideShowSettings.Run()
+                self._view = self.slideshow.View  # Bind once; navigation reuses it
                 logger.info("Started slideshow")
                 return True
             
@@ -151,15 +206,15 @@ class PowerPointController:
         try:
             if not self.simulation_mode and self.slideshow:
                 # Real PowerPoint
-                self.slideshow.View.Next()
+                self._view.Next()
                 self.current_slide = min(self.current_slide + 1, self.total_slides)
-                logger.info(f"Next slide: {self.current_slide}")
+                logger.info("Next slide: %d", self.current_slide)
                 return True
             
             else:
                 # Simulation
                 self.current_slide = min(self.current_slide + 1, self.total_slides)
-                logger.info(f"Next slide (simulation): {self.current_slide}")
+                logger.info("Next slide (simulation): %d", self.current_slide)
                 return True
         
         except Exception as e:
@@ -174,15 +229,15 @@ class PowerPointController:
         try:
             if not self.simulation_mode and self.slideshow:
                 # Real PowerPoint
-                self.slideshow.View.Previous()
+                self._view.Previous()
                 self.current_slide = max(self.current_slide - 1, 1)
-                logger.info(f"Previous slide: {self.current_slide}")
+                logger.info("Previous slide: %d", self.current_slide)
                 return True
             
             else:
                 # Simulation
                 self.current_slide = max(self.current_slide - 1, 1)
-                logger.info(f"Previous slide (simulation): {self.current_slide}")
+                logger.info("Previous slide (simulation): %d", self.current_slide)
                 return True
         
         except Exception as e:
@@ -209,21 +264,40 @@ class PowerPointController:
         try:
             if not self.simulation_mode and self.slideshow:
                 # Real PowerPoint
-                self.slideshow.View.GotoSlide(slide_number)
+                self._view.GotoSlide(slide_number)
                 self.current_slide = slide_number
-                logger.info(f"Went to slide: {slide_number}")
+                logger.info("Went to slide: %d", slide_number)
                 return True
             
             else:
                 # Simulation
                 self.current_slide = slide_number
-                logger.info(f"Went to slide (simulation): {slide_number}")
+                logger.info("Went to slide (simulation): %d", slide_number)
                 return True
         
         except Exception as e:
             logger.error(f"Error going to slide {slide_number}: {str(e)}")
             return False
     
+    def advance(self, n: int) -> bool:
+        """
+        Jump n slides forward (negative for backward) in a single call.
+
+        Args:
+            n: Number of slides to move by
+
+        Returns:
+            True if successful, False otherwise
+
+        Unlike calling next_slide() in a loop, which pays one COM
+        round-trip per step, this resolves the move to one GotoSlide.
+        """
+        if not self.connected and not self.connect():
+            return False
+
+        target = max(1, min(self.total_slides, self.current_slide + n))
+        return self.goto_slide(target)
+
     def end_slideshow(self) -> bool:
         """End the slideshow."""
         if not self.connected:
@@ -232,7 +306,8 @@ class PowerPointController:
         try:
             if not self.simulation_mode and self.slideshow:
                 # Real PowerPoint
-                self.slideshow.View.Exit()
+                self._view.Exit()
+                self._view = None
                 self.slideshow = None
                 logger.info("Ended slideshow")
             
@@ -274,12 +349,17 @@ class PowerPointController:
             logger.error(f"Error closing PowerPoint: {str(e)}")
             return False
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get the current status of the PowerPoint controller."""
-        return {
-            "connected": self.connected,
-            "simulation_mode": self.simulation_mode,
-            "presentation_path": self.presentation_path,
-            "current_slide": self.current_slide,
-            "total_slides": self.total_slides
-        }
\ No newline at end of file
+    def get_status(self) -> Mapping[str, Any]:
+        """
+        Get the current status of the PowerPoint controller.
+
+        Returns a read-only view of a reused dict, so frequent polling
+        doesn't allocate; callers needing a mutable copy can dict() it.
+        """
+        status = self._status
+        status["connected"] = self.connected
+        status["simulation_mode"] = self.simulation_mode
+        status["presentation_path"] = self.presentation_path
+        status["current_slide"] = self.current_slide
+        status["total_slides"] = self.total_slides
+        return self._status_view
\ No newline at end of file
@@ -15,6 +15,63 @@ from typing import Dict, Any, Optional, Callable
 # Configure logging
 logger = logging.getLogger("SystemMonitor")
 
+class _LinuxFastSampler:
+    """
+    Reads CPU, memory and disk metrics straight from /proc and statvfs.
+    Keeps the pseudo-file descriptors open across samples, avoiding the
+    per-call open/parse/NamedTuple work psutil does — worthwhile for a
+    long-running background thread.
+    """
+
+    def __init__(self):
+        self._stat_fd = os.open("/proc/stat", os.O_RDONLY)
+        self._mem_fd = os.open("/proc/meminfo", os.O_RDONLY)
+        self._last_total = 0
+        self._last_idle = 0
+        self.cpu_percent()  # Prime the baseline; the first reading is discarded
+
+    def cpu_percent(self) -> float:
+        """CPU usage since the previous call, from the /proc/stat totals."""
+        data = os.pread(self._stat_fd, 512, 0)
+        values = [int(v) for v in data.split(b"\n", 1)[0].split()[1:]]
+        idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+        total = sum(values)
+        delta_total = total - self._last_total
+        delta_idle = idle - self._last_idle
+        self._last_total = total
+        self._last_idle = idle
+        if delta_total <= 0:
+            return 0.0
+        return round(100.0 * (delta_total - delta_idle) / delta_total, 1)
+
+    def memory_percent(self) -> float:
+        """Memory usage from MemTotal/MemAvailable in /proc/meminfo."""
+        data = os.pread(self._mem_fd, 2048, 0)
+        total = available = None
+        for line in data.split(b"\n"):
+            if line.startswith(b"MemTotal:"):
+                total = int(line.split()[1])
+            elif line.startswith(b"MemAvailable:"):
+                available = int(line.split()[1])
+                break
+        if not total or available is None:
+            return 0.0
+        return round(100.0 * (total - available) / total, 1)
+
+    def disk_percent(self, path: str = "/") -> float:
+        """Disk usage of the filesystem at path via a single statvfs call."""
+        st = os.statvfs(path)
+        used = st.f_blocks - st.f_bfree
+        total = used + st.f_bavail
+        if total == 0:
+            return 0.0
+        return round(100.0 * used / total, 1)
+
+    def close(self):
+        os.close(self._stat_fd)
+        os.close(self._mem_fd)
+
+
 class SystemMonitor(threading.Thread):
     """
     Monitors system health metrics including CPU, memory, disk, and network.
@@ -34,6 +91,7 @@ class SystemMonitor(threading.Thread):
         self.config = config
         self.callback = callback
         self.running = False
+        self._stop_event = threading.Event()
         self.interval = config.get("health_check_interval", 30)  # seconds
         self.cpu_threshold_warning = 80
         self.cpu_threshold_critical = 90
@@ -42,14 +100,31 @@ class SystemMonitor(threading.Thread):
         self.disk_threshold_warning = 80
         self.disk_threshold_critical = 90
         
-        # Import platform-specific modules
-        try:
-            import psutil
-            self.psutil = psutil
-        except ImportError:
-            logger.error("psutil module not found. System monitoring will be limited.")
-            self.psutil = None
+        # Sampling backends (psutil / the /proc fast sampler) are imported
+        # and probed lazily on the first sample inside the thread, so
+        # constructing a monitor that is never started stays cheap.
+        self.psutil = None
+        self._fast_sampler = None
+        self._has_temp_sensors = False
+        self._has_battery_sensor = False
+        self._backends_ready = False
         
+        # Network probe state: the target is resolved once and probed only
+        # every few cycles; in between the cached status is returned.
+        self._probe_addr = None
+        self._net_status = "OK"
+        self._net_tick = 0
+
+        # Disk/temperature/battery change slowly, so they are sampled at
+        # roughly a 5-minute cadence while CPU/memory follow the base interval.
+        self._tick = 0
+        self._slow_every = max(1, 300 // max(1, self.interval))
+
+        # Callback coalescing: the last delivered snapshot and how many
+        # cycles have passed since, so no-op updates can be suppressed.
+        self._last_sent = None
+        self._cycles_since_send = 0
+
         # Initialize health data
         self.health_data = {
             "cpu": 0,
@@ -82,44 +157,121 @@ class SystemMonitor(threading.Thread):
                 # Determine overall status
                 self._update_status()
                 
-                # Call callback if provided
-                if self.callback:
-                    self.callback(self.health_data)
+                # Call callback if provided, skipping redundant updates
+                self._notify()
                 
                 # Log warnings if thresholds exceeded
                 self._log_warnings()
                 
-                # Sleep until next check
-                time.sleep(self.interval)
-            
+                # Wait until next check; returns early when stop() is called
+                if self._stop_event.wait(self.interval):
+                    break
+
             except Exception as e:
                 logger.error(f"Error in system monitor: {str(e)}")
-                time.sleep(5)  # Wait and retry on error
+                if self._stop_event.wait(5):  # Wait and retry on error
+                    break
     
+    def _ensure_backends(self):
+        """Import and probe the sampling backends on first use."""
+        if self._backends_ready:
+            return
+        self._backends_ready = True
+
+        try:
+            import psutil
+            self.psutil = psutil
+            # Prime the internal baseline so later interval=None calls
+            # return immediately from kernel counters instead of blocking.
+            # This first reading is 0.0 and is discarded.
+            self.psutil.cpu_percent(interval=None)
+        except ImportError:
+            logger.error("psutil module not found. System monitoring will be limited.")
+
+        # On Linux, sample CPU/memory/disk straight from /proc and statvfs;
+        # psutil remains the fallback on other platforms (and for sensors).
+        if platform.system() == "Linux":
+            try:
+                self._fast_sampler = _LinuxFastSampler()
+            except OSError as e:
+                logger.debug(f"Fast /proc sampler unavailable: {str(e)}")
+
+        # Probe sensor support once so the per-cycle getters can skip
+        # unsupported APIs without paying for an exception each time.
+        if self.psutil:
+            try:
+                self._has_temp_sensors = bool(self.psutil.sensors_temperatures())
+            except (AttributeError, OSError, NotImplementedError):
+                pass
+            try:
+                self._has_battery_sensor = self.psutil.sensors_battery() is not None
+            except (AttributeError, OSError, NotImplementedError):
+                pass
+
     def _update_health_data(self):
         """Update all health metrics."""
+        self._ensure_backends()
+
         # CPU usage
         self.health_data["cpu"] = self._get_cpu_usage()
         
         # Memory usage
         self.health_data["memory"] = self._get_memory_usage()
         
-        # Disk usage
-        self.health_data["disk"] = self._get_disk_usage()
-        
         # Network status
         self.health_data["network"] = self._get_network_status()
-        
-        # System temperature (if available)
-        temp = self._get_temperature()
-        if temp is not None:
-            self.health_data["temperature"] = temp
-        
-        # Battery status (if available)
-        battery = self._get_battery_status()
-        if battery is not None:
-            self.health_data["battery"] = battery
+
+        # Slow-changing metrics: sample only every _slow_every cycles,
+        # leaving the previous values in place between samples.
+        if self._tick % self._slow_every == 0:
+            # Disk usage
+            self.health_data["disk"] = self._get_disk_usage()
+
+            # System temperature (if available)
+            temp = self._get_temperature()
+            if temp is not None:
+                self.health_data["temperature"] = temp
+
+            # Battery status (if available)
+            battery = self._get_battery_status()
+            if battery is not None:
+                self.health_data["battery"] = battery
+
+        self._tick += 1
     
+    def _notify(self):
+        """
+        Deliver health data to the callback, coalescing no-op updates.
+
+        Status and network transitions always go through so alerts are
+        never missed; otherwise updates where CPU/memory moved by less
+        than one point and disk is unchanged are dropped, capped at ten
+        skipped cycles so listeners still get a periodic heartbeat.
+        """
+        if not self.callback:
+            return
+
+        data = self.health_data
+        last = self._last_sent
+        self._cycles_since_send += 1
+        if last is not None and self._cycles_since_send < 10:
+            if (data["status"] == last["status"]
+                    and data["network"] == last["network"]
+                    and data["disk"] == last["disk"]
+                    and abs(data["cpu"] - last["cpu"]) < 1
+                    and abs(data["memory"] - last["memory"]) < 1):
+                return
+
+        self.callback(data)
+        self._last_sent = {
+            "cpu": data["cpu"],
+            "memory": data["memory"],
+            "disk": data["disk"],
+            "network": data["network"],
+            "status": data["status"]
+        }
+        self._cycles_since_send = 0
+
     def _update_status(self):
         """Update the overall system status based on metrics."""
         if (self.health_data["cpu"] > self.cpu_threshold_critical or
@@ -139,49 +291,71 @@ class SystemMonitor(threading.Thread):
     def _log_warnings(self):
         """Log warnings if thresholds are exceeded."""
         if self.health_data["status"] == "CRITICAL":
-            logger.warning(f"CRITICAL: System resources critical: "
-                          f"CPU {self.health_data['cpu']}%, "
-                          f"Memory {self.health_data['memory']}%, "
-                          f"Disk {self.health_data['disk']}%, "
-                          f"Network {self.health_data['network']}")
-        
+            # Lazy %-style args: the message is only built if the record
+            # is actually emitted.
+            logger.warning("CRITICAL: System resources critical: "
+                           "CPU %s%%, Memory %s%%, Disk %s%%, Network %s",
+                           self.health_data["cpu"], self.health_data["memory"],
+                           self.health_data["disk"], self.health_data["network"])
+
         elif self.health_data["status"] == "WARNING":
-            logger.info(f"WARNING: System resources high: "
-                       f"CPU {self.health_data['cpu']}%, "
-                       f"Memory {self.health_data['memory']}%, "
-                       f"Disk {self.health_data['disk']}%")
+            logger.info("WARNING: System resources high: "
+                        "CPU %s%%, Memory %s%%, Disk %s%%",
+                        self.health_data["cpu"], self.health_data["memory"],
+                        self.health_data["disk"])
     
     def _get_cpu_usage(self) -> float:
         """Get CPU usage percentage."""
+        if self._fast_sampler:
+            return self._fast_sampler.cpu_percent()
         if self.psutil:
-            return self.psutil.cpu_percent()
+            # Non-blocking: measures usage since the previous call
+            return self.psutil.cpu_percent(interval=None)
         return 0
-    
+
     def _get_memory_usage(self) -> float:
         """Get memory usage percentage."""
+        if self._fast_sampler:
+            return self._fast_sampler.memory_percent()
         if self.psutil:
             return self.psutil.virtual_memory().percent
         return 0
-    
+
     def _get_disk_usage(self) -> float:
         """Get disk usage percentage."""
+        if self._fast_sampler:
+            return self._fast_sampler.disk_percent('/')
         if self.psutil:
             return self.psutil.disk_usage('/').percent
         return 0
     
     def _get_network_status(self) -> str:
-        """Get network status."""
+        """Get network status via a cheap TCP probe to a cached address."""
+        import socket
+
+        # Re-probe only every 10th cycle while the network looks healthy;
+        # otherwise return the cached result without touching the network.
+        self._net_tick += 1
+        if self._net_status == "OK" and self._net_tick % 10 != 1:
+            return self._net_status
+
         try:
-            # Simple check: Try to resolve a hostname
-            import socket
-            socket.gethostbyname("www.google.com")
-            return "OK"
-        except:
-            return "ERROR"
+            if self._probe_addr is None:
+                # Resolve once; DNS is only redone after a failed probe
+                self._probe_addr = socket.getaddrinfo(
+                    "www.google.com", 443, type=socket.SOCK_STREAM)[0][4]
+            with socket.create_connection(self._probe_addr, timeout=1.5):
+                pass
+            self._net_status = "OK"
+        except OSError:
+            self._probe_addr = None  # Force re-resolution next probe
+            self._net_status = "ERROR"
+
+        return self._net_status
     
     def _get_temperature(self) -> Optional[float]:
         """Get CPU temperature if available."""
-        if self.psutil:
+        if self.psutil and self._has_temp_sensors:
             try:
                 temps = self.psutil.sensors_temperatures()
                 if temps:
@@ -191,13 +365,13 @@ class SystemMonitor(threading.Thread):
                         if entries:
                             # Return the first temperature reading
                             return entries[0].current
-            except:
+            except (AttributeError, OSError, NotImplementedError):
                 pass
         return None
     
     def _get_battery_status(self) -> Optional[Dict[str, Any]]:
         """Get battery status if available."""
-        if self.psutil:
+        if self.psutil and self._has_battery_sensor:
             try:
                 battery = self.psutil.sensors_battery()
                 if battery:
@@ -206,7 +380,7 @@ class SystemMonitor(threading.Thread):
                         "power_plugged": battery.power_plugged,
                         "seconds_left": battery.secsleft if battery.secsleft != -1 else None
                     }
-            except:
+            except (AttributeError, OSError, NotImplementedError):
                 pass
         return None
     
@@ -216,4 +390,5 @@ class SystemMonitor(threading.Thread):
     
     def stop(self):
         """Stop the monitor thread."""
-        self.running = False
\ No newline at end of file
+        self.running = False
+        self._stop_event.set()
\ No newline at end of file
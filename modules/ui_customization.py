@@ -8,12 +8,137 @@ import shutil
 import logging
 import json
 import base64
+import hashlib
+import re
+import string
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 # Configure logging
 logger = logging.getLogger("UICustomization")
 
+# Optional fast JSON decoder; stdlib json is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Animation CSS is static; build it once at import time
+_ANIMATION_CSS = """/* Animation classes */
+.animate-fade-in {
+  animation: fadeIn 0.5s ease-in-out;
+}
+
+.animate-slide-in {
+  animation: slideIn 0.5s ease-in-out;
+}
+
+.animate-slide-up {
+  animation: slideUp 0.3s ease-in-out;
+}
+
+.animate-pulse {
+  animation: pulse 2s infinite;
+}
+
+@keyframes fadeIn {
+  from { opacity: 0; }
+  to { opacity: 1; }
+}
+
+@keyframes slideIn {
+  from { transform: translateX(-20px); opacity: 0; }
+  to { transform: translateX(0); opacity: 1; }
+}
+
+@keyframes slideUp {
+  from { transform: translateY(20px); opacity: 0; }
+  to { transform: translateY(0); opacity: 1; }
+}
+
+@keyframes pulse {
+  0% { opacity: 1; }
+  50% { opacity: 0.7; }
+  100% { opacity: 1; }
+}
+
+/* Transitions */
+.transition-all {
+  transition: all 0.3s ease;
+}
+
+.hover-scale:hover {
+  transform: scale(1.05);
+}
+
+.hover-bright:hover {
+  filter: brightness(1.1);
+}
+"""
+
+# Defaults normalized into every discovered theme so later code can
+# index fields directly instead of paying .get() defaults per access
+_THEME_DEFAULTS = {
+    "description": "",
+    "author": "Unknown",
+    "version": "1.0",
+    "dark_mode": False,
+}
+
+
+def _validate_theme(theme_data: Any) -> Dict[str, Any]:
+    """
+    Validate a parsed theme.json once at discovery time, normalizing
+    optional fields in place. Raises ValueError for malformed themes so
+    they are rejected early instead of failing downstream.
+    """
+    if not isinstance(theme_data, dict):
+        raise ValueError("theme.json must contain a JSON object")
+
+    name = theme_data.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError("theme.json requires a non-empty 'name' string")
+
+    for key, default in _THEME_DEFAULTS.items():
+        theme_data.setdefault(key, default)
+
+    if not isinstance(theme_data["dark_mode"], bool):
+        raise ValueError("'dark_mode' must be a boolean")
+
+    return theme_data
+
+
+# Insertion points handled by inject_css_into_html in a single pass
+_INJECT_RE = re.compile(r"<!-- CUSTOM_CSS_PLACEHOLDER -->|</head>|<body>")
+
+# CSS fragments anchoring the logo to each supported position
+_LOGO_POSITION_CSS = {
+    "top-left": "  top: 20px;\n  left: 20px;\n",
+    "top-right": "  top: 20px;\n  right: 20px;\n",
+    "bottom-left": "  bottom: 20px;\n  left: 20px;\n",
+    "bottom-right": "  bottom: 20px;\n  right: 20px;\n",
+    # custom would need additional parameters; anchor top-right for now
+    "custom": "  top: 20px;\n  right: 20px;\n",
+}
+
+# Upload filename sanitization: a translate table deleting everything
+# outside [A-Za-z0-9._-] runs as a single C-level pass
+_FILENAME_DELETE_TABLE = str.maketrans("", "", "".join(
+    chr(i) for i in range(256)
+    if chr(i) not in string.ascii_letters + string.digits + "._-"))
+_VALID_LOGO_EXTS = frozenset([".png", ".jpg", ".jpeg", ".svg", ".gif"])
+
+# MIME types for supported logo/preview image extensions
+_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".svg": "image/svg+xml",
+    ".gif": "image/gif",
+}
+
 class UICustomizer:
     """
     Handles UI customization including themes, logo management, and animations.
@@ -29,8 +154,27 @@ class UICustomizer:
         self.themes_folder.mkdir(parents=True, exist_ok=True)
         self.logos_folder.mkdir(parents=True, exist_ok=True)
         
-        # Cache for rendered templates
-        self.template_cache = {}
+        # Bounded LRU cache for rendered templates, keyed on a fingerprint
+        # of the template content plus the customization state, so any
+        # mutator automatically invalidates without manual clears.
+        self.template_cache: OrderedDict = OrderedDict()
+        self._template_cache_max = 128
+
+        # Memoized CSS output; rebuilt only after a theme/logo/animation
+        # mutator invalidates it.
+        self._css_cache: Optional[str] = None
+        self._logo_css_cache: Optional[str] = None
+
+        # Cached (path, mtime, data URI) for the base64-encoded logo
+        self._logo_b64_cache: Optional[Tuple[str, float, str]] = None
+
+        # Theme CSS file contents keyed by path, with the mtime they
+        # were read at; re-read only when the file changes
+        self._theme_css_cache: Dict[str, Tuple[float, str]] = {}
+
+        # Combined theme+logo CSS with its ETag, keyed by the identity
+        # of the component strings so it follows their invalidation
+        self._full_css_cache: Optional[Tuple[str, str, str, str]] = None
         
         # Initialize theme data
         self.available_themes = self._discover_themes()
@@ -50,8 +194,9 @@ class UICustomizer:
             "font-family": self.config.get("font_family", "Arial, sans-serif"),
         }
         
-        # Load the current theme
+        # Load the current theme and precompute the logo CSS
         self.load_theme(self.current_theme)
+        self._compute_logo_css()
     
     def _discover_themes(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -71,120 +216,193 @@ class UICustomizer:
             "preview_image": None
         }
         
-        # Look for theme JSON files
-        for theme_file in self.themes_folder.glob("*/theme.json"):
-            try:
-                with open(theme_file, 'r') as f:
-                    theme_data = json.load(f)
-                
-                theme_id = theme_file.parent.name
-                theme_data["css_file"] = str(theme_file.parent / "theme.css")
-                
-                # Check for preview image
-                preview_path = theme_file.parent / "preview.png"
-                if preview_path.exists():
-                    theme_data["preview_image"] = str(preview_path)
-                else:
-                    theme_data["preview_image"] = None
-                
-                themes[theme_id] = theme_data
-                logger.info(f"Discovered theme: {theme_data['name']} ({theme_id})")
-            
-            except Exception as e:
-                logger.error(f"Error loading theme {theme_file}: {str(e)}")
-        
+        # Collect theme directories and theme.json signatures in one
+        # scandir pass; cheaper than the pathlib glob selector chain,
+        # which allocates a Path per directory
+        theme_dirs = {}
+        signatures = {}
+        with os.scandir(self.themes_folder) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+
+                theme_file = os.path.join(entry.path, "theme.json")
+                try:
+                    st = os.stat(theme_file)
+                except OSError:
+                    continue
+
+                theme_dirs[entry.name] = entry.path
+                signatures[entry.name] = [st.st_mtime_ns, st.st_size]
+
+        # If nothing changed since the last scan, reuse the cached
+        # manifest and skip re-parsing every theme.json
+        manifest_path = os.path.join(self.themes_folder, ".manifest.json")
+        cached = self._read_theme_manifest(manifest_path)
+        if cached is not None and cached.get("sig") == signatures:
+            themes.update(cached["themes"])
+        else:
+            for theme_id, theme_dir in theme_dirs.items():
+                theme_file = os.path.join(theme_dir, "theme.json")
+                try:
+                    # Read bytes and hand them to the decoder (orjson
+                    # wants bytes; json.loads accepts them too)
+                    with open(theme_file, 'rb') as f:
+                        theme_data = _validate_theme(_json_loads(f.read()))
+
+                    theme_data["css_file"] = os.path.join(theme_dir, "theme.css")
+
+                    # Check for preview image
+                    preview_path = os.path.join(theme_dir, "preview.png")
+                    if os.path.isfile(preview_path):
+                        theme_data["preview_image"] = preview_path
+                    else:
+                        theme_data["preview_image"] = None
+
+                    themes[theme_id] = theme_data
+                    logger.info(f"Discovered theme: {theme_data['name']} ({theme_id})")
+
+                except Exception as e:
+                    logger.error(f"Error loading theme {theme_file}: {str(e)}")
+                    signatures.pop(theme_id, None)
+
+            self._write_theme_manifest(manifest_path, signatures, themes)
+
+        # Precompute the public listing once; get_available_themes only
+        # patches the is_current flag per call
+        self._public_theme_view = [
+            {
+                "id": theme_id,
+                "name": theme_data["name"],
+                "description": theme_data["description"],
+                "author": theme_data["author"],
+                "version": theme_data["version"],
+                "dark_mode": theme_data["dark_mode"],
+                "has_preview": theme_data["preview_image"] is not None
+            }
+            for theme_id, theme_data in themes.items()
+        ]
+
         return themes
     
+    def _read_theme_manifest(self, manifest_path: str) -> Optional[Dict[str, Any]]:
+        """Read the cached theme manifest; None if missing or unreadable."""
+        try:
+            with open(manifest_path, 'rb') as f:
+                manifest = _json_loads(f.read())
+            if isinstance(manifest, dict) and "sig" in manifest and "themes" in manifest:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_theme_manifest(self, manifest_path: str, signatures: Dict[str, Any],
+                              themes: Dict[str, Dict[str, Any]]) -> None:
+        """Persist the scan result so later startups can skip re-parsing."""
+        try:
+            manifest = {
+                "sig": signatures,
+                "themes": {tid: data for tid, data in themes.items() if tid != "default"}
+            }
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f)
+        except OSError as e:
+            logger.debug(f"Could not write theme manifest: {str(e)}")
+
     def get_available_themes(self) -> List[Dict[str, Any]]:
         """
         Get information about all available themes.
         Returns a list of theme information dictionaries.
         """
-        theme_list = []
-        
-        for theme_id, theme_data in self.available_themes.items():
-            theme_info = {
-                "id": theme_id,
-                "name": theme_data["name"],
-                "description": theme_data.get("description", ""),
-                "author": theme_data.get("author", "Unknown"),
-                "version": theme_data.get("version", "1.0"),
-                "dark_mode": theme_data.get("dark_mode", False),
-                "is_current": theme_id == self.current_theme,
-                "has_preview": theme_data.get("preview_image") is not None
-            }
-            
-            theme_list.append(theme_info)
-        
-        return theme_list
+        # All fields except is_current were precomputed at discovery time
+        return [
+            {**theme_info, "is_current": theme_info["id"] == self.current_theme}
+            for theme_info in self._public_theme_view
+        ]
     
     def load_theme(self, theme_id: str) -> bool:
         """
         Load a theme by ID.
         Returns True if successful, False otherwise.
         """
+        if not self._load_theme_nosync(theme_id):
+            return False
+
+        # Clear the CSS cache since theme changed; the template cache
+        # keys on theme state, so it self-invalidates
+        self._css_cache = None
+        return True
+
+    def _load_theme_nosync(self, theme_id: str) -> bool:
+        """Switch themes without invalidating caches; see apply_settings."""
         if theme_id not in self.available_themes:
             logger.error(f"Theme not found: {theme_id}")
             return False
-        
+
         try:
             theme_data = self.available_themes[theme_id]
-            
+
             # Update current theme
             self.current_theme = theme_id
-            
+
             # If theme has a CSS file, load color variables from it
             if theme_data.get("css_file") and os.path.exists(theme_data["css_file"]):
                 # TODO: Parse CSS file to extract variables (more complex implementation)
                 pass
-            
+
             # Update theme-specific color variables if provided
             if "colors" in theme_data:
                 for key, value in theme_data["colors"].items():
                     css_key = f"{key}-color"
                     if css_key in self.css_variables:
                         self.css_variables[css_key] = value
-            
+
             # Update config
             self.config["theme"] = theme_id
-            
-            # Clear template cache since theme changed
-            self.template_cache = {}
-            
+
             logger.info(f"Loaded theme: {theme_data['name']} ({theme_id})")
             return True
-        
+
         except Exception as e:
             logger.error(f"Error loading theme {theme_id}: {str(e)}")
             return False
     
+    def choose_logo_path(self, filename: str) -> Path:
+        """Return the sanitized destination path for an uploaded logo."""
+        # Sanitize filename
+        safe_filename = filename.translate(_FILENAME_DELETE_TABLE).lower()
+
+        # Ensure it has a supported extension
+        if os.path.splitext(safe_filename)[1] not in _VALID_LOGO_EXTS:
+            safe_filename += ".png"
+
+        return self.logos_folder / safe_filename
+
+    def set_logo_file(self, logo_path) -> str:
+        """Record a logo file that has already been written to disk."""
+        self.logo_path = str(logo_path)
+        self.config["logo_path"] = self.logo_path
+        self._compute_logo_css()
+
+        logger.info(f"Uploaded logo: {os.path.basename(self.logo_path)}")
+        return self.logo_path
+
     def upload_logo(self, logo_data: bytes, filename: str) -> Optional[str]:
         """
-        Upload a new logo image.
+        Upload a new logo image from an in-memory buffer.
         Returns the path to the saved logo if successful, None otherwise.
+        Large uploads should stream to choose_logo_path() and then call
+        set_logo_file() instead of buffering the whole file here.
         """
         try:
-            # Sanitize filename
-            safe_filename = "".join(c for c in filename if c.isalnum() or c in "._-").lower()
-            
-            # Ensure it has an extension
-            if not any(safe_filename.endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.svg', '.gif']):
-                safe_filename += ".png"
-            
-            # Full path to save
-            logo_path = self.logos_folder / safe_filename
-            
+            logo_path = self.choose_logo_path(filename)
+
             # Save the file
             with open(logo_path, 'wb') as f:
                 f.write(logo_data)
-            
-            # Update config
-            self.logo_path = str(logo_path)
-            self.config["logo_path"] = self.logo_path
-            
-            logger.info(f"Uploaded logo: {safe_filename}")
-            return self.logo_path
-        
+
+            return self.set_logo_file(logo_path)
+
         except Exception as e:
             logger.error(f"Error uploading logo: {str(e)}")
             return None
@@ -195,17 +413,22 @@ class UICustomizer:
         Valid positions: top-left, top-right, bottom-left, bottom-right, custom
         Returns True if successful, False otherwise.
         """
+        if not self._set_logo_position_nosync(position):
+            return False
+
+        # Recompute the logo CSS at set-time
+        self._compute_logo_css()
+        return True
+
+    def _set_logo_position_nosync(self, position: str) -> bool:
+        """Validate and store the logo position without rebuilding CSS."""
         valid_positions = ["top-left", "top-right", "bottom-left", "bottom-right", "custom"]
         if position not in valid_positions:
             logger.error(f"Invalid logo position: {position}")
             return False
-        
+
         self.logo_position = position
         self.config["logo_position"] = position
-        
-        # Clear template cache
-        self.template_cache = {}
-        
         logger.info(f"Set logo position: {position}")
         return True
     
@@ -214,54 +437,103 @@ class UICustomizer:
         Set the logo size in pixels.
         Returns True if successful, False otherwise.
         """
+        if not self._set_logo_size_nosync(size):
+            return False
+
+        # Recompute the logo CSS at set-time
+        self._compute_logo_css()
+        return True
+
+    def _set_logo_size_nosync(self, size: int) -> bool:
+        """Validate and store the logo size without rebuilding CSS."""
         if size < 10 or size > 500:
             logger.error(f"Invalid logo size: {size} (must be between 10 and 500)")
             return False
-        
+
         self.logo_size = size
         self.config["logo_size"] = size
-        
-        # Clear template cache
-        self.template_cache = {}
-        
         logger.info(f"Set logo size: {size}px")
         return True
     
     def set_animation_enabled(self, enabled: bool) -> None:
         """Enable or disable UI animations."""
+        self._set_animation_enabled_nosync(enabled)
+
+        # Clear the CSS cache
+        self._css_cache = None
+
+    def _set_animation_enabled_nosync(self, enabled: bool) -> None:
+        """Store the animation flag without invalidating the CSS cache."""
         self.animation_enabled = enabled
         self.config["animation_enabled"] = enabled
-        
-        # Clear template cache
-        self.template_cache = {}
-        
         logger.info(f"Set animations: {'enabled' if enabled else 'disabled'}")
+
+    def apply_settings(self, *, theme: Optional[str] = None,
+                       logo_position: Optional[str] = None,
+                       logo_size: Optional[int] = None,
+                       animation_enabled: Optional[bool] = None) -> Dict[str, bool]:
+        """
+        Apply several settings as one batch.
+
+        Mutates every provided field via the nosync setters, then
+        invalidates the CSS caches once at the end, so an "apply
+        settings" dialog triggers a single rebuild instead of one per
+        field. Returns a dict mapping each provided field to whether it
+        was accepted.
+        """
+        results = {}
+        if theme is not None:
+            results["theme"] = self._load_theme_nosync(theme)
+        if logo_position is not None:
+            results["logo_position"] = self._set_logo_position_nosync(logo_position)
+        if logo_size is not None:
+            results["logo_size"] = self._set_logo_size_nosync(logo_size)
+        if animation_enabled is not None:
+            self._set_animation_enabled_nosync(animation_enabled)
+            results["animation_enabled"] = True
+
+        if any(results.values()):
+            self._css_cache = None
+            self._compute_logo_css()
+
+        return results
     
     def get_logo_as_base64(self) -> Optional[str]:
         """
         Get the current logo as a base64-encoded string.
         Returns None if no logo is set or the file doesn't exist.
         """
-        if not self.logo_path or not os.path.exists(self.logo_path):
+        if not self.logo_path:
             return None
-        
+
         try:
+            # Reuse the encoded data URI while the file is unchanged;
+            # the steady-state cost is a single stat call.
+            mtime = os.stat(self.logo_path).st_mtime
+            cached = self._logo_b64_cache
+            if cached and cached[0] == self.logo_path and cached[1] == mtime:
+                return cached[2]
+
             with open(self.logo_path, 'rb') as f:
                 logo_data = f.read()
-            
+
             # Determine mime type
-            mime_type = "image/png"  # Default
-            if self.logo_path.endswith('.jpg') or self.logo_path.endswith('.jpeg'):
-                mime_type = "image/jpeg"
-            elif self.logo_path.endswith('.svg'):
-                mime_type = "image/svg+xml"
-            elif self.logo_path.endswith('.gif'):
-                mime_type = "image/gif"
-            
-            # Encode as base64
-            encoded = base64.b64encode(logo_data).decode('utf-8')
-            return f"data:{mime_type};base64,{encoded}"
-        
+            ext = os.path.splitext(self.logo_path)[1].lower()
+            mime_type = _MIME_TYPES.get(ext, "image/png")
+
+            # Encode as base64: join prefix and payload as bytes and
+            # decode once, instead of allocating intermediate strings
+            encoded = base64.b64encode(memoryview(logo_data))
+            data_uri = b"".join(
+                [b"data:", mime_type.encode('ascii'), b";base64,", encoded]
+            ).decode('ascii')
+            self._logo_b64_cache = (self.logo_path, mtime, data_uri)
+            return data_uri
+
+        except FileNotFoundError:
+            # EAFP: no separate exists() check, so a missing file is a
+            # normal outcome rather than an error
+            return None
         except Exception as e:
             logger.error(f"Error encoding logo: {str(e)}")
             return None
@@ -274,121 +546,96 @@ class UICustomizer:
         """
         Get the custom CSS for the current theme.
         This includes CSS variables and any theme-specific styles.
+        The built string is memoized until a mutator invalidates it.
         """
-        css = ":root {\n"
-        
+        if self._css_cache is not None:
+            return self._css_cache
+
+        parts = [":root {\n"]
+
         # Add CSS variables
         for key, value in self.css_variables.items():
-            css += f"  --{key}: {value};\n"
-        
-        css += "}\n\n"
-        
+            parts.append(f"  --{key}: {value};\n")
+
+        parts.append("}\n\n")
+
         # Add animation classes if enabled
         if self.animation_enabled:
-            css += self._get_animation_css()
-        
+            parts.append(_ANIMATION_CSS)
+
         # Add theme-specific CSS if available
         theme_data = self.available_themes.get(self.current_theme, {})
-        if theme_data.get("css_file") and os.path.exists(theme_data["css_file"]):
+        css_file = theme_data.get("css_file")
+        if css_file:
             try:
-                with open(theme_data["css_file"], 'r') as f:
-                    theme_css = f.read()
-                css += "\n/* Theme-specific CSS */\n"
-                css += theme_css
+                mtime = os.stat(css_file).st_mtime
+                cached = self._theme_css_cache.get(css_file)
+                if cached and cached[0] == mtime:
+                    theme_css = cached[1]
+                else:
+                    with open(css_file, 'r') as f:
+                        theme_css = f.read()
+                    self._theme_css_cache[css_file] = (mtime, theme_css)
+                parts.append("\n/* Theme-specific CSS */\n")
+                parts.append(theme_css)
+            except FileNotFoundError:
+                pass  # Themes without a theme.css are fine
             except Exception as e:
                 logger.error(f"Error reading theme CSS: {str(e)}")
-        
+
+        css = "".join(parts)
+        self._css_cache = css
         return css
     
     def _get_animation_css(self) -> str:
         """Get CSS for animations."""
-        return """/* Animation classes */
-.animate-fade-in {
-  animation: fadeIn 0.5s ease-in-out;
-}
-
-.animate-slide-in {
-  animation: slideIn 0.5s ease-in-out;
-}
-
-.animate-slide-up {
-  animation: slideUp 0.3s ease-in-out;
-}
-
-.animate-pulse {
-  animation: pulse 2s infinite;
-}
-
-@keyframes fadeIn {
-  from { opacity: 0; }
-  to { opacity: 1; }
-}
-
-@keyframes slideIn {
-  from { transform: translateX(-20px); opacity: 0; }
-  to { transform: translateX(0); opacity: 1; }
-}
-
-@keyframes slideUp {
-  from { transform: translateY(20px); opacity: 0; }
-  to { transform: translateY(0); opacity: 1; }
-}
-
-@keyframes pulse {
-  0% { opacity: 1; }
-  50% { opacity: 0.7; }
-  100% { opacity: 1; }
-}
-
-/* Transitions */
-.transition-all {
-  transition: all 0.3s ease;
-}
-
-.hover-scale:hover {
-  transform: scale(1.05);
-}
-
-.hover-bright:hover {
-  filter: brightness(1.1);
-}
-"""
+        return _ANIMATION_CSS
     
+    def _compute_logo_css(self) -> None:
+        """Rebuild the logo positioning CSS; called from the logo setters."""
+        position_css = _LOGO_POSITION_CSS.get(
+            self.logo_position, _LOGO_POSITION_CSS["top-right"])
+        self._logo_css_cache = "".join([
+            "#conference-logo {\n",
+            f"  width: {self.logo_size}px;\n",
+            "  height: auto;\n",
+            "  position: absolute;\n",
+            position_css,
+            "  z-index: 1000;\n",
+            "}\n"
+        ])
+
     def get_logo_css(self) -> str:
         """
         Get CSS for logo positioning and sizing.
         This can be included in the templates to correctly position the logo.
+        The CSS is precomputed at set-time, so this is an attribute read.
         """
         if not self.logo_path:
             return ""
-        
-        css = "#conference-logo {\n"
-        css += f"  width: {self.logo_size}px;\n"
-        css += "  height: auto;\n"
-        css += "  position: absolute;\n"
-        
-        # Position the logo
-        if self.logo_position == "top-left":
-            css += "  top: 20px;\n"
-            css += "  left: 20px;\n"
-        elif self.logo_position == "top-right":
-            css += "  top: 20px;\n"
-            css += "  right: 20px;\n"
-        elif self.logo_position == "bottom-left":
-            css += "  bottom: 20px;\n"
-            css += "  left: 20px;\n"
-        elif self.logo_position == "bottom-right":
-            css += "  bottom: 20px;\n"
-            css += "  right: 20px;\n"
-        else:  # custom - in this case, we would need additional parameters
-            css += "  top: 20px;\n"
-            css += "  right: 20px;\n"
-        
-        css += "  z-index: 1000;\n"
-        css += "}\n"
-        
-        return css
+
+        if self._logo_css_cache is None:
+            self._compute_logo_css()
+        return self._logo_css_cache
     
+    def get_full_css(self) -> Tuple[str, str]:
+        """
+        Get the combined theme and logo CSS along with a strong ETag.
+        Both the combined string and its hash are reused while the
+        underlying memoized components are unchanged.
+        """
+        css = self.get_custom_css()
+        logo_css = self.get_logo_css() if self.logo_path else ""
+
+        cached = self._full_css_cache
+        if cached and cached[0] is css and cached[1] is logo_css:
+            return cached[2], cached[3]
+
+        full_css = f"{css}\n{logo_css}" if logo_css else css
+        etag = '"' + hashlib.blake2b(full_css.encode(), digest_size=16).hexdigest() + '"'
+        self._full_css_cache = (css, logo_css, full_css, etag)
+        return full_css, etag
+
     def inject_css_into_html(self, html_content: str) -> str:
         """
         Inject custom CSS into an HTML document.
@@ -402,26 +649,45 @@ class UICustomizer:
             
             # Wrap in style tags
             style_tag = f"<style>\n{css_content}\n</style>"
-            
-            # Look for a specific placeholder or insert before </head>
-            if "<!-- CUSTOM_CSS_PLACEHOLDER -->" in html_content:
-                html_content = html_content.replace("<!-- CUSTOM_CSS_PLACEHOLDER -->", style_tag)
-            else:
-                html_content = html_content.replace("</head>", f"{style_tag}\n</head>")
-            
-            # Add logo if available
+
+            # Reference the logo endpoint instead of inlining a base64
+            # data URI: the browser caches the file once rather than
+            # re-downloading ~1.33x the logo size with every page.
+            logo_html = None
             if self.logo_path:
-                logo_data = self.get_logo_as_base64()
-                if logo_data:
-                    logo_html = f'<img id="conference-logo" src="{logo_data}" alt="Conference Logo">'
-                    if "<body>" in html_content:
-                        html_content = html_content.replace("<body>", f"<body>\n{logo_html}")
-                    else:
-                        # Find a suitable insertion point
-                        insert_marker = "<div class=\"container"
-                        if insert_marker in html_content:
-                            html_content = html_content.replace(insert_marker, f"{logo_html}\n{insert_marker}")
-            
+                logo_html = ('<img id="conference-logo" src="/api/ui/logo/file" '
+                             'alt="Conference Logo">')
+
+            # Insert the CSS (at the placeholder, or before </head>) and
+            # the logo (after <body>) in one pass over the HTML instead
+            # of a full .replace scan per insertion point
+            css_done = False
+            logo_done = logo_html is None
+
+            def _insert(match):
+                nonlocal css_done, logo_done
+                token = match.group(0)
+                if token == "<body>":
+                    if logo_done:
+                        return token
+                    logo_done = True
+                    return f"<body>\n{logo_html}"
+                # Placeholder or </head>
+                if css_done:
+                    return token
+                css_done = True
+                if token == "<!-- CUSTOM_CSS_PLACEHOLDER -->":
+                    return style_tag
+                return f"{style_tag}\n</head>"
+
+            html_content = _INJECT_RE.sub(_insert, html_content)
+
+            # Fallback insertion point for templates without a plain <body>
+            if not logo_done:
+                insert_marker = "<div class=\"container"
+                if insert_marker in html_content:
+                    html_content = html_content.replace(insert_marker, f"{logo_html}\n{insert_marker}")
+
             return html_content
         
         except Exception as e:
@@ -440,25 +706,45 @@ class UICustomizer:
         Returns:
             The themed template content
         """
+        # Fingerprint the content together with every piece of state that
+        # affects the output, so stale entries can never be returned
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((self.current_theme, self.logo_path, self.logo_position,
+                       self.logo_size, self.animation_enabled)).encode())
+        h.update(template_content.encode())
+        cache_key = h.hexdigest()
+
         # Check cache first
-        cache_key = f"{template_name}_{self.current_theme}"
-        if cache_key in self.template_cache:
-            return self.template_cache[cache_key]
+        cached = self.template_cache.get(cache_key)
+        if cached is not None:
+            self.template_cache.move_to_end(cache_key)
+            return cached
         
         # Process the template
         processed = self.inject_css_into_html(template_content)
         
-        # Cache the result
+        # Cache the result, evicting the least recently used on overflow
         self.template_cache[cache_key] = processed
+        if len(self.template_cache) > self._template_cache_max:
+            self.template_cache.popitem(last=False)
         
         return processed
 
 # FastAPI routes for UI customization
 def setup_ui_routes(app, ui_customizer):
     """Set up FastAPI routes for UI customization."""
-    from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-    from fastapi.responses import Response
-    
+    import asyncio
+    from fastapi import APIRouter, HTTPException, Request, UploadFile, File, Form
+    from fastapi.responses import Response, FileResponse
+    from pydantic import BaseModel
+
+    class UISettings(BaseModel):
+        """Batched settings payload; omitted fields are left unchanged."""
+        theme: Optional[str] = None
+        logo_position: Optional[str] = None
+        logo_size: Optional[int] = None
+        animation_enabled: Optional[bool] = None
+
     router = APIRouter()
     
     @router.get("/api/ui/themes")
@@ -500,11 +786,15 @@ def setup_ui_routes(app, ui_customizer):
     async def upload_logo(file: UploadFile = File(...)):
         """Upload a new logo."""
         try:
-            # Read file content
-            content = await file.read()
-            
-            # Upload logo
-            path = ui_customizer.upload_logo(content, file.filename)
+            # Stream the upload to disk in 1 MiB chunks rather than
+            # buffering the whole file in memory; each write runs on a
+            # worker thread so the event loop stays free
+            dest = ui_customizer.choose_logo_path(file.filename)
+            with open(dest, 'wb') as out:
+                while chunk := await file.read(1 << 20):
+                    await asyncio.to_thread(out.write, chunk)
+
+            path = ui_customizer.set_logo_file(dest)
             if path:
                 return {"success": True, "message": "Logo uploaded successfully", "path": path}
             else:
@@ -512,6 +802,20 @@ def setup_ui_routes(app, ui_customizer):
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error uploading logo: {str(e)}")
     
+    @router.get("/api/ui/logo/file")
+    async def get_logo_file():
+        """Serve the current logo file directly so browsers can cache it."""
+        logo_path = ui_customizer.logo_path
+        if not logo_path or not os.path.exists(logo_path):
+            raise HTTPException(status_code=404, detail="No logo available")
+
+        ext = os.path.splitext(logo_path)[1].lower()
+        return FileResponse(
+            logo_path,
+            media_type=_MIME_TYPES.get(ext, "image/png"),
+            headers={"Cache-Control": "public, max-age=86400"}
+        )
+
     @router.post("/api/ui/logo/position")
     async def set_logo_position(position: str = Form(...)):
         """Set the logo position."""
@@ -528,6 +832,26 @@ def setup_ui_routes(app, ui_customizer):
         else:
             raise HTTPException(status_code=400, detail=f"Invalid size: {size}")
     
+    @router.post("/api/ui/settings")
+    async def apply_ui_settings(settings: UISettings):
+        """Apply several UI settings in one request and one cache rebuild."""
+        results = ui_customizer.apply_settings(
+            theme=settings.theme,
+            logo_position=settings.logo_position,
+            logo_size=settings.logo_size,
+            animation_enabled=settings.animation_enabled
+        )
+        if not results:
+            raise HTTPException(status_code=400, detail="No settings provided")
+
+        rejected = [field for field, ok in results.items() if not ok]
+        if rejected:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid settings: {', '.join(rejected)}")
+
+        return {"success": True, "applied": list(results)}
+
     @router.post("/api/ui/animations")
     async def set_animations(enabled: bool = Form(...)):
         """Enable or disable animations."""
@@ -535,12 +859,19 @@ def setup_ui_routes(app, ui_customizer):
         return {"success": True, "message": f"Animations {'enabled' if enabled else 'disabled'}"}
     
     @router.get("/api/ui/css")
-    async def get_custom_css():
+    async def get_custom_css(request: Request):
         """Get the custom CSS for the current theme."""
-        css = ui_customizer.get_custom_css()
-        if ui_customizer.logo_path:
-            css += "\n" + ui_customizer.get_logo_css()
-        
-        return Response(content=css, media_type="text/css")
+        css, etag = ui_customizer.get_full_css()
+
+        # Let browsers and proxies revalidate cheaply: matching ETags
+        # skip the body entirely
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        return Response(
+            content=css,
+            media_type="text/css",
+            headers={"ETag": etag, "Cache-Control": "public, max-age=300"}
+        )
     
     app.include_router(router)
\ No newline at end of file
@@ -7,37 +7,294 @@ This module handles:
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import logging
-import uuid
-from typing import Dict, List, Optional
+import secrets
+import shutil
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Literal, Optional
 import sys
 
 import av
-from aiortc import MediaStreamTrack, RTCPeerConnection, RTCSessionDescription
+from aiortc import MediaStreamTrack, RTCPeerConnection, RTCRtpSender, RTCSessionDescription
 from aiortc.contrib.media import MediaPlayer, MediaRelay
 
 # Configure logging
 logger = logging.getLogger("WebRTC")
 
+# Optional brotli compression for the client script
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _probe_h264_encoder() -> str:
+    """
+    Pick the best H.264 encoder available on this machine.
+
+    Hardware encoders (NVENC, QuickSync, VideoToolbox) encode 1080p
+    several times faster than software x264 and keep the CPU free for
+    the rest of the system, so they are preferred whenever the ffmpeg
+    build exposes one. Falls back to libx264.
+    """
+    if sys.platform == "darwin":
+        candidates = ["h264_videotoolbox"]
+    elif sys.platform == "win32":
+        candidates = ["h264_nvenc", "h264_qsv"]
+    else:
+        # Only try NVENC when an NVIDIA driver is actually present;
+        # probing the codec without one can be slow
+        candidates = []
+        if shutil.which("nvidia-smi"):
+            candidates.append("h264_nvenc")
+        candidates += ["h264_qsv", "h264_vaapi"]
+
+    for name in candidates:
+        try:
+            av.codec.Codec(name, "w")
+            logger.info(f"Using hardware H.264 encoder: {name}")
+            return name
+        except Exception:
+            continue
+
+    logger.info("No hardware H.264 encoder available; using libx264")
+    return "libx264"
+
+
+_H264_ENCODER = _probe_h264_encoder()
+
+
+def _install_hw_encoder() -> None:
+    """
+    Point aiortc's H.264 encoder at the detected hardware codec.
+
+    aiortc builds its encoder context by codec name, so substituting the
+    name is enough. Any failure (older aiortc without the factory hook,
+    codec refusing to open) leaves the stock libx264 path untouched.
+    """
+    if _H264_ENCODER == "libx264":
+        return
+
+    try:
+        from aiortc.codecs import h264 as aiortc_h264
+
+        original = aiortc_h264.create_encoder_context
+
+        def hw_create_encoder_context(codec_name, *args, **kwargs):
+            return original(_H264_ENCODER, *args, **kwargs)
+
+        aiortc_h264.create_encoder_context = hw_create_encoder_context
+    except (ImportError, AttributeError) as e:
+        logger.warning(f"Could not install hardware encoder {_H264_ENCODER}: {str(e)}")
+
+
+_install_hw_encoder()
+
+
+class _SharedH264Encoder:
+    """
+    Wrap a single H.264 encoder so each source frame is encoded once.
+
+    Every sender streams the same relay frames, so the encoded payloads
+    for a given pts are identical across peers: the first sender to ask
+    pays for the encode and the rest reuse the cached result. This
+    makes encoder cost O(1) in viewer count instead of O(N). A forced
+    keyframe busts the cache so the IDR reaches every peer.
+    """
+
+    def __init__(self, inner):
+        object.__setattr__(self, "_inner", inner)
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_cached_pts", None)
+        object.__setattr__(self, "_cached_result", None)
+        object.__setattr__(self, "_want_keyframe", False)
+
+    def force_keyframe(self):
+        """Make the next encoded frame an IDR (e.g. for a late joiner)."""
+        object.__setattr__(self, "_want_keyframe", True)
+
+    def encode(self, frame, force_keyframe=False):
+        pts = getattr(frame, "pts", None)
+        with self._lock:
+            if self._want_keyframe:
+                force_keyframe = True
+                object.__setattr__(self, "_want_keyframe", False)
+            if force_keyframe or pts is None or pts != self._cached_pts:
+                result = self._inner.encode(frame, force_keyframe)
+                object.__setattr__(self, "_cached_result", result)
+                object.__setattr__(self, "_cached_pts", pts)
+            return self._cached_result
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+    def __setattr__(self, name, value):
+        # Senders tune e.g. target_bitrate on their encoder; forward
+        # those writes so the one real encoder sees them
+        setattr(self._inner, name, value)
+
+
+# Shared encoder instances by mime type, populated by the patched
+# factory below; request_keyframe() reaches the live encoder through it
+_shared_encoders: Dict[str, _SharedH264Encoder] = {}
+
+
+def request_keyframe() -> None:
+    """
+    Ask the shared encoder to emit an IDR on the next frame.
+
+    Called when a new viewer joins so they start decoding immediately
+    instead of waiting out the current GOP (or showing corrupted blocks
+    until the next scheduled keyframe). A PLI from any peer has the same
+    effect through aiortc's normal RTCP path, since the forced keyframe
+    busts the shared cache and the IDR fans out to everyone.
+    """
+    encoder = _shared_encoders.get("video/H264")
+    if encoder is not None:
+        encoder.force_keyframe()
+
+
+def _install_shared_encoder() -> None:
+    """
+    Route every video/H264 sender through one shared encoder instance.
+
+    aiortc builds a fresh encoder per RTCRtpSender; since all senders
+    here carry the identical screen track, that re-encodes the same
+    frames N times. Patching the encoder factory (both in the codecs
+    module and where the sender imported it by name) shares one
+    pts-memoizing encoder instead. Any failure leaves stock behavior.
+    """
+    try:
+        from aiortc import codecs as aiortc_codecs
+        from aiortc import rtcrtpsender as aiortc_sender
+
+        original_get_encoder = aiortc_codecs.get_encoder
+
+        def shared_get_encoder(codec):
+            if codec.mimeType == "video/H264":
+                encoder = _shared_encoders.get(codec.mimeType)
+                if encoder is None:
+                    encoder = _SharedH264Encoder(original_get_encoder(codec))
+                    _shared_encoders[codec.mimeType] = encoder
+                return encoder
+            return original_get_encoder(codec)
+
+        aiortc_codecs.get_encoder = shared_get_encoder
+        if getattr(aiortc_sender, "get_encoder", None) is original_get_encoder:
+            aiortc_sender.get_encoder = shared_get_encoder
+    except (ImportError, AttributeError) as e:
+        logger.warning(f"Could not install shared H.264 encoder: {str(e)}")
+
+
+_install_shared_encoder()
+
+# Opening the capture device (av.open under MediaPlayer) blocks for
+# hundreds of milliseconds; run it on this dedicated thread so SDP
+# negotiation and other handlers on the event loop are never stalled.
+# MediaPlayer itself already demuxes/decodes on its own worker thread.
+_capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screen-capture")
+
 # Global state
 relay = MediaRelay()
-pcs: Dict[str, RTCPeerConnection] = {}
+
+# Peer connections are tracked weakly; _pc_pins holds the strong
+# reference only while a connection is live. If cleanup is ever missed
+# (exception in a handler, abrupt client death) dropping the pin is
+# enough for the GC to reap the connection instead of leaking it.
+pcs: "weakref.WeakValueDictionary[str, RTCPeerConnection]" = weakref.WeakValueDictionary()
+
+# Strong refs in insertion order, capped at MAX_PCS: once full, the
+# oldest connection is closed rather than letting repeated offers grow
+# memory without bound. A background reaper additionally closes
+# connections stuck in new/connecting longer than _STALE_TTL seconds.
+MAX_PCS = 64
+_STALE_TTL = 60.0
+_pc_pins: "OrderedDict[str, RTCPeerConnection]" = OrderedDict()
+_pc_created: Dict[str, float] = {}
+_reaper_task: Optional[asyncio.Task] = None
+
+
+async def _reap_stale_connections():
+    while True:
+        await asyncio.sleep(30)
+        now = time.monotonic()
+        for pc_id, created in list(_pc_created.items()):
+            pc = _pc_pins.get(pc_id)
+            if (pc is not None and now - created > _STALE_TTL
+                    and pc.connectionState in ("new", "connecting")):
+                logger.info(f"Reaping stale peer connection {pc_id}")
+                await cleanup_peer_connection(pc_id)
+
+# Small pool of pre-built peer connections: constructing one generates a
+# DTLS certificate, which is the expensive part of create_offer. Filling
+# the pool on a background task moves that cost off the request path, so
+# bursty viewer joins don't serialize certificate generation.
+_PC_POOL_SIZE = 4
+_pc_pool: List[RTCPeerConnection] = []
+_pc_pool_task: Optional[asyncio.Task] = None
+
+
+async def _fill_pc_pool():
+    while len(_pc_pool) < _PC_POOL_SIZE:
+        _pc_pool.append(RTCPeerConnection())
+        await asyncio.sleep(0)  # Yield between certificate generations
+
+
+def _take_peer_connection() -> RTCPeerConnection:
+    """Hand out a pooled peer connection and top the pool back up."""
+    global _pc_pool_task
+
+    pc = _pc_pool.pop() if _pc_pool else RTCPeerConnection()
+    if _pc_pool_task is None or _pc_pool_task.done():
+        _pc_pool_task = asyncio.ensure_future(_fill_pc_pool())
+    return pc
 screen_track: Optional[MediaStreamTrack] = None
 active = False
 screen_source = "desktop"  # desktop or window
 
+# Serializes capture startup: without it, N offers racing the
+# active-check would each spawn an ffmpeg capture process
+_start_lock = asyncio.Lock()
+
 class ScreenCaptureTrack(MediaStreamTrack):
     """Media track for capturing the screen using ffmpeg."""
     
     kind = "video"
     
-    def __init__(self, source="desktop"):
+    def __init__(self, source="desktop", width=1280, height=720, fps=15):
         super().__init__()
         self.source = source
+        self.width = width
+        self.height = height
+        self.fps = fps
+        # 720p15 is the screen-share default: slides are mostly static,
+        # so the quarter of 1080p30's pixel rate halves capture and
+        # encode cost with no visible loss; callers can override.
         options = {
-            "framerate": "30",
-            "video_size": "1920x1080"
+            "framerate": str(fps),
+            "video_size": f"{width}x{height}",
+            # Capture plugins that can't honor the requested geometry
+            # directly get a filter chain instead
+            "vf": f"fps={fps},scale={width}:{height}",
+            # Generous capture-side buffering smooths bursts from the
+            # grabber instead of dropping or syscall-thrashing on every
+            # frame — a small latency trade that is right for screen
+            # share. Plugins ignore options they don't implement.
+            "rtbufsize": "64M",
+            "thread_queue_size": "512",
+            # Ask the grabber for the encoder-native pixel format so no
+            # swscale reformat pass (a ~1.5 byte/pixel copy per frame)
+            # sits between capture and encode; NV12 is the native
+            # surface format for NVENC and VideoToolbox
+            "pix_fmt": ("nv12" if _H264_ENCODER in ("h264_nvenc", "h264_videotoolbox")
+                        else "yuv420p"),
         }
         
         if source == "desktop":
@@ -57,29 +314,68 @@ class ScreenCaptureTrack(MediaStreamTrack):
                 # Fallback to desktop
                 self.player = MediaPlayer("desktop", format="x11grab", options=options)
         
-        self.track = relay.subscribe(self.player.video)
-    
+        # Subscriptions are taken per peer in create_offer, so this
+        # single MediaPlayer stays the one capture source no matter how
+        # many viewers attach. Direct consumers of this track get
+        # latest-frame delivery: a pump task started on first recv()
+        # signals an Event per new frame, so recv() wakes exactly when a
+        # frame lands instead of polling, and a slow consumer sees the
+        # newest frame rather than a backlog.
+        self._subscription = None
+        self._pump_task = None
+        self._new_frame: Optional[asyncio.Event] = None
+        # Double buffer: the pump writes into one slot while readers
+        # hold the other, then publishes by flipping the index. At most
+        # two decoded frames (and their ~MB plane buffers) stay alive,
+        # and a reader never sees its frame replaced mid-use.
+        self._frames = [None, None]
+        self._read_idx = 0
+
+    async def _pump(self):
+        while True:
+            frame = await self._subscription.recv()
+            write_idx = self._read_idx ^ 1
+            self._frames[write_idx] = frame
+            self._read_idx = write_idx  # Publish; old slot becomes scratch
+            self._new_frame.set()
+
     async def recv(self):
-        frame = await self.track.recv()
-        return frame
+        if self._pump_task is None:
+            self._subscription = relay.subscribe(self.player.video, buffered=False)
+            self._new_frame = asyncio.Event()
+            self._pump_task = asyncio.ensure_future(self._pump())
+        await self._new_frame.wait()
+        self._new_frame.clear()
+        return self._frames[self._read_idx]
+
+    def stop(self):
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            self._pump_task = None
+        super().stop()
 
-async def start_screen_capture(source="desktop"):
+async def start_screen_capture(source="desktop", width=1280, height=720, fps=15):
     """Start capturing the screen for WebRTC streaming."""
     global screen_track, active, screen_source
-    
-    if active and screen_track:
-        logger.info("Screen capture already active")
-        return
-    
-    try:
-        screen_source = source
-        screen_track = ScreenCaptureTrack(source)
-        active = True
-        logger.info(f"Started screen capture from {source}")
-    except Exception as e:
-        logger.error(f"Error starting screen capture: {str(e)}")
-        active = False
-        screen_track = None
+
+    async with _start_lock:
+        # Re-check under the lock: concurrent callers that raced past
+        # their own checks all await here and find capture running
+        if active and screen_track:
+            logger.info("Screen capture already active")
+            return
+
+        try:
+            screen_source = source
+            loop = asyncio.get_running_loop()
+            screen_track = await loop.run_in_executor(
+                _capture_executor, ScreenCaptureTrack, source, width, height, fps)
+            active = True
+            logger.info(f"Started screen capture from {source}")
+        except Exception as e:
+            logger.error(f"Error starting screen capture: {str(e)}")
+            active = False
+            screen_track = None
 
 async def stop_screen_capture():
     """Stop screen capture and clean up resources."""
@@ -94,23 +390,61 @@ async def stop_screen_capture():
 
 async def create_offer():
     """Create an offer for a new WebRTC peer connection."""
+    global _reaper_task
+
     if not active or not screen_track:
         await start_screen_capture(screen_source)
-    
-    pc_id = str(uuid.uuid4())
-    pc = RTCPeerConnection()
+
+    # 72 bits of entropy is plenty for an ephemeral id, and this is
+    # cheaper and shorter on the wire than a formatted uuid4
+    pc_id = secrets.token_urlsafe(9)
+    pc = _take_peer_connection()
     pcs[pc_id] = pc
-    
+    _pc_pins[pc_id] = pc
+    _pc_created[pc_id] = time.monotonic()
+
+    # Enforce the cap by closing the oldest connection(s)
+    while len(_pc_pins) > MAX_PCS:
+        oldest_id = next(iter(_pc_pins))
+        await cleanup_peer_connection(oldest_id)
+
+    if _reaper_task is None or _reaper_task.done():
+        _reaper_task = asyncio.ensure_future(_reap_stale_connections())
+
     @pc.on("connectionstatechange")
     async def on_connectionstatechange():
         logger.info(f"Connection state changed to {pc.connectionState}")
         if pc.connectionState == "failed" or pc.connectionState == "closed":
+            # Drop the pin first so the connection can be collected even
+            # if the close below raises
+            _pc_pins.pop(pc_id, None)
             await cleanup_peer_connection(pc_id)
     
-    # Add video track
+    # Add video track: each peer gets its own relay subscription of the
+    # shared capture source, so the ffmpeg process and decode run once
+    # regardless of viewer count and frames never interleave across peers.
+    # buffered=False delivers the latest frame and drops older ones for
+    # slow consumers instead of queueing them — the right semantics for a
+    # live screen share, and it keeps latency bounded at high peer counts.
     if screen_track:
-        pc.addTrack(screen_track)
-    
+        pc.addTrack(relay.subscribe(screen_track.player.video, buffered=False))
+
+        # Negotiate H.264 only: without preferences aiortc advertises VP8
+        # first, which forces software libvpx encoding and bypasses the
+        # hardware encoder path entirely
+        h264_codecs = [
+            c for c in RTCRtpSender.getCapabilities("video").codecs
+            if c.mimeType == "video/H264"
+        ]
+        if h264_codecs:
+            for transceiver in pc.getTransceivers():
+                if transceiver.kind == "video":
+                    transceiver.setCodecPreferences(h264_codecs)
+
+        # Late joiner: refresh the stream with an IDR so this viewer
+        # doesn't wait for the next scheduled keyframe
+        request_keyframe()
+
     # Create offer
     offer = await pc.createOffer()
     await pc.setLocalDescription(offer)
@@ -140,24 +474,36 @@ async def process_answer(pc_id, answer_sdp, answer_type):
         return False
 
 async def cleanup_peer_connection(pc_id):
-    """Clean up a peer connection and remove it from the list."""
-    if pc_id in pcs:
-        pc = pcs[pc_id]
-        
-        # Close the connection
-        await pc.close()
-        
-        # Remove from the list
-        del pcs[pc_id]
-        
-        logger.info(f"Cleaned up peer connection {pc_id}")
+    """Clean up a peer connection and remove it from the registry."""
+    _pc_created.pop(pc_id, None)
+    pc = _pc_pins.pop(pc_id, None) or pcs.pop(pc_id, None)
+    if pc is None:
+        return
+
+    # Close the connection; the weak entry disappears once pc is collected
+    await pc.close()
+    pcs.pop(pc_id, None)
+
+    logger.info(f"Cleaned up peer connection {pc_id}")
 
 async def cleanup_all_connections():
     """Clean up all peer connections and stop screen capture."""
-    # Close all peer connections
-    close_tasks = [cleanup_peer_connection(pc_id) for pc_id in list(pcs.keys())]
+    # Close all peer connections with bounded parallelism: an unbounded
+    # gather over hundreds of peers would run that many DTLS shutdown
+    # handshakes at once and spike the event loop
+    sem = asyncio.Semaphore(16)
+
+    async def _close(pc_id):
+        async with sem:
+            await cleanup_peer_connection(pc_id)
+
+    close_tasks = [_close(pc_id) for pc_id in list(pcs.keys())]
     await asyncio.gather(*close_tasks)
-    
+
+    # Drain the never-used pooled connections as well
+    while _pc_pool:
+        await _pc_pool.pop().close()
+
     # Stop screen capture
     await stop_screen_capture()
     
@@ -256,13 +602,62 @@ class WebRTCClient {
 }
 """
 
+# Pre-encode the client script once at import time: raw bytes, gzip and
+# (when available) brotli variants, plus a strong ETag for cheap 304s.
+# Serving then picks a ready-made body instead of re-encoding per hit.
+_CLIENT_JS = webrtc_client_js.encode("utf-8")
+_CLIENT_JS_GZ = gzip.compress(_CLIENT_JS, compresslevel=9)
+_CLIENT_JS_BR = brotli.compress(_CLIENT_JS, quality=11) if brotli else None
+_CLIENT_JS_ETAG = '"' + hashlib.blake2b(_CLIENT_JS, digest_size=16).hexdigest() + '"'
+
 # FastAPI routes for WebRTC signaling
 def setup_webrtc_routes(app):
     """Set up FastAPI routes for WebRTC signaling."""
-    from fastapi import APIRouter, HTTPException
-    
+    from fastapi import APIRouter, HTTPException, Request
+    from fastapi.responses import Response
+    from pydantic import BaseModel
+
+    # Validated in pydantic-core instead of hand-rolled key checks on a
+    # dict; malformed payloads get FastAPI's automatic 422
+    class AnswerBody(BaseModel):
+        id: str
+        sdp: str
+        type: Literal["answer"]
+
+    class DisconnectBody(BaseModel):
+        id: str
+
+    class StartBody(BaseModel):
+        source: str = "desktop"
+        width: int = 1280
+        height: int = 720
+        fps: int = 15
+
     router = APIRouter()
-    
+
+    @router.get("/api/webrtc/client.js")
+    async def webrtc_client_script(request: Request):
+        """Serve the pre-encoded WebRTC client script."""
+        if request.headers.get("if-none-match") == _CLIENT_JS_ETAG:
+            return Response(status_code=304, headers={"ETag": _CLIENT_JS_ETAG})
+
+        headers = {
+            "ETag": _CLIENT_JS_ETAG,
+            "Cache-Control": "public, max-age=86400",
+            "Vary": "Accept-Encoding",
+        }
+        accepted = request.headers.get("accept-encoding", "")
+        if _CLIENT_JS_BR is not None and "br" in accepted:
+            content = _CLIENT_JS_BR
+            headers["Content-Encoding"] = "br"
+        elif "gzip" in accepted:
+            content = _CLIENT_JS_GZ
+            headers["Content-Encoding"] = "gzip"
+        else:
+            content = _CLIENT_JS
+        return Response(content=content, media_type="application/javascript",
+                        headers=headers)
+
     @router.get("/api/webrtc/offer")
     async def webrtc_offer():
         try:
@@ -273,37 +668,32 @@ def setup_webrtc_routes(app):
             raise HTTPException(status_code=500, detail="Error creating WebRTC offer")
     
     @router.post("/api/webrtc/answer")
-    async def webrtc_answer(data: dict):
+    async def webrtc_answer(body: AnswerBody):
         try:
-            if "id" not in data or "sdp" not in data or "type" not in data:
-                raise HTTPException(status_code=400, detail="Missing required fields")
-            
-            success = await process_answer(data["id"], data["sdp"], data["type"])
+            success = await process_answer(body.id, body.sdp, body.type)
             if not success:
                 raise HTTPException(status_code=400, detail="Could not process answer")
-            
+
             return {"success": True}
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error processing answer: {str(e)}")
             raise HTTPException(status_code=500, detail="Error processing WebRTC answer")
-    
+
     @router.post("/api/webrtc/disconnect")
-    async def webrtc_disconnect(data: dict):
+    async def webrtc_disconnect(body: DisconnectBody):
         try:
-            if "id" not in data:
-                raise HTTPException(status_code=400, detail="Missing peer connection ID")
-            
-            await cleanup_peer_connection(data["id"])
+            await cleanup_peer_connection(body.id)
             return {"success": True}
         except Exception as e:
             logger.error(f"Error disconnecting: {str(e)}")
             raise HTTPException(status_code=500, detail="Error disconnecting WebRTC")
-    
+
     @router.post("/api/webrtc/start")
-    async def webrtc_start(data: dict):
+    async def webrtc_start(body: StartBody):
         try:
-            source = data.get("source", "desktop")
-            await start_screen_capture(source)
+            await start_screen_capture(body.source, body.width, body.height, body.fps)
             return {"success": True}
         except Exception as e:
             logger.error(f"Error starting screen capture: {str(e)}")